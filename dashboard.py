@@ -1,19 +1,104 @@
-import json
+import logging
 import os
+import threading
+import time
+import zlib
 from pathlib import Path
 
-from flask import Flask, render_template
+import orjson
+from flask import Flask, Response, request, stream_template
 
 app = Flask(__name__)
+logger = logging.getLogger(__name__)
+
+DATA_FILE = Path("marktplaats_listings.json")
+# Interval, in seconds, between checks for a new scraper output file.
+REFRESH_SECONDS = int(os.getenv("DASHBOARD_REFRESH_SECONDS", "5"))
+
+# Uncompressed bytes collected before a gzip chunk is flushed to the client.
+GZIP_CHUNK_SIZE = 16 * 1024
+
+# Latest listings snapshot; ``None`` when the data file does not exist.
+LISTINGS_CACHE = None
+LISTINGS_LOCK = threading.Lock()
+_refresher = None
+# Modification time of the data file the snapshot was parsed from.
+_snapshot_mtime = None
+
+
+def _load_listings():
+    """Return the current listings, re-parsing the file only when it changed."""
+    global _snapshot_mtime
+    try:
+        mtime = DATA_FILE.stat().st_mtime
+    except FileNotFoundError:
+        _snapshot_mtime = None
+        return None
+    if mtime == _snapshot_mtime:
+        return LISTINGS_CACHE
+    listings = orjson.loads(DATA_FILE.read_bytes())
+    _snapshot_mtime = mtime
+    return listings
+
+
+def _refresh_loop():
+    global LISTINGS_CACHE
+    while True:
+        time.sleep(REFRESH_SECONDS)
+        try:
+            listings = _load_listings()
+        except (OSError, ValueError) as exc:
+            # The file may be unreadable or vanish between stat() and read.
+            logger.warning("Keeping previous listings snapshot: %s", exc)
+            continue
+        with LISTINGS_LOCK:
+            LISTINGS_CACHE = listings
+
+
+def _start_refresher():
+    """Load the initial snapshot and start the background refresh thread."""
+    global LISTINGS_CACHE, _refresher
+    with LISTINGS_LOCK:
+        if _refresher is not None:
+            return
+        try:
+            LISTINGS_CACHE = _load_listings()
+        except (OSError, ValueError) as exc:
+            # Leave the snapshot empty; the refresh thread retries the load.
+            logger.warning("Could not load listings snapshot: %s", exc)
+        _refresher = threading.Thread(target=_refresh_loop, daemon=True)
+        _refresher.start()
+
+
+def _gzip_stream(chunks):
+    """Gzip a stream of text chunks without buffering the whole body."""
+    compressor = zlib.compressobj(wbits=31)
+    pending = 0
+    for chunk in chunks:
+        data = chunk.encode()
+        pending += len(data)
+        out = compressor.compress(data)
+        if pending >= GZIP_CHUNK_SIZE:
+            out += compressor.flush(zlib.Z_SYNC_FLUSH)
+            pending = 0
+        if out:
+            yield out
+    yield compressor.flush()
+
 
 @app.route("/")
 def index():
-    data_file = Path("marktplaats_listings.json")
-    if data_file.exists():
-        listings = json.loads(data_file.read_text())
-    else:
-        listings = None
-    return render_template("dashboard.html", listings=listings)
+    _start_refresher()
+    with LISTINGS_LOCK:
+        listings = LISTINGS_CACHE
+    # Stream the page so large listing grids start rendering immediately.
+    body = stream_template("dashboard.html", listings=listings)
+    if not request.accept_encodings["gzip"]:
+        return Response(body, mimetype="text/html")
+    response = Response(_gzip_stream(body), mimetype="text/html")
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
 
 if __name__ == "__main__":
     app.run(debug=os.getenv("FLASK_DEBUG") == "1")
@@ -9,16 +9,20 @@ listing page and parse its ``__NEXT_DATA__`` object to obtain the remaining
 data.
 """
 
-import json
+import asyncio
+import math
+import os
 import random
+import re
 import sqlite3
-import time
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import orjson
+from selectolax.lexbor import LexborHTMLParser
 
 
 logger = logging.getLogger(__name__)
@@ -26,6 +30,21 @@ logger = logging.getLogger(__name__)
 SEARCH_URL = "https://www.marktplaats.nl/q/solis+espresso+apparaat"
 DB_PATH = "data.db"
 
+# Maximum number of HTTP requests in flight at any time.
+MAX_CONCURRENCY = 10
+# Total timeout, in seconds, for a single HTTP request.
+REQUEST_TIMEOUT = 30
+# Seconds an idle connection is kept open for reuse.
+KEEPALIVE_TIMEOUT = 30
+# Responses with these statuses are retried with exponential backoff.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+# Upper bound, in seconds, on a delay requested through ``Retry-After``.
+MAX_RETRY_AFTER = 60
+# Detail pages fetched more recently than this are served from the cache.
+DETAILS_CACHE_TTL = timedelta(hours=6)
+
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
@@ -40,6 +59,36 @@ DEFAULT_HEADERS = {
     "TE": "trailers",
 }
 
+# Product fields that can be filled in from a listing's detail page.
+DETAIL_FIELDS = (
+    "description",
+    "seller_name",
+    "seller_rating",
+    "start_date",
+    "shipping_options",
+    "attributes",
+)
+# Search result price types for listings that cannot receive bids.  Any other
+# price type, including unknown ones, is assumed to take bids.
+NO_BIDDING_PRICE_TYPES = frozenset({"FREE", "EXCHANGE", "RESERVED"})
+
+# Keywords sellers use for defective items, matched in a single pass.
+BROKEN_KEYWORDS = ("defect", "broken", "parts", "spares", "repair")
+_BROKEN_RE = re.compile("|".join(map(re.escape, BROKEN_KEYWORDS)))
+
+_NEXT_DATA_RE = re.compile(
+    rb'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+)
+
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    """Open ``path`` in WAL mode so writes need fewer fsyncs."""
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
 
 
 def _init_db(conn: sqlite3.Connection) -> None:
@@ -68,63 +117,105 @@ def _init_db(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+def _open_details_cache(path: str) -> sqlite3.Connection:
+    """Open the database at ``path`` that caches listing details.
+
+    The caller owns the connection and must close it when the scrape ends.
+    """
+
+    conn = _connect(path)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS details_cache (
+            url TEXT PRIMARY KEY,
+            fetched_at TEXT,
+            json TEXT
+        )
+        """
+    )
+    # Drop entries that have expired since they can never be served again.
+    cutoff = (datetime.utcnow() - DETAILS_CACHE_TTL).isoformat()
+    conn.execute("DELETE FROM details_cache WHERE fetched_at < ?", (cutoff,))
+    conn.commit()
+    return conn
+
+
+def _cached_details(cache: sqlite3.Connection, url: str) -> Optional[Dict[str, Any]]:
+    """Return cached details for ``url`` unless they are older than the TTL."""
+
+    cutoff = (datetime.utcnow() - DETAILS_CACHE_TTL).isoformat()
+    row = cache.execute(
+        "SELECT json FROM details_cache WHERE url=? AND fetched_at >= ?",
+        (url, cutoff),
+    ).fetchone()
+    return orjson.loads(row[0]) if row else None
+
+
+def _store_details(
+    cache: sqlite3.Connection, url: str, details: Dict[str, Any]
+) -> None:
+    with cache:
+        cache.execute(
+            "INSERT OR REPLACE INTO details_cache (url, fetched_at, json) VALUES (?, ?, ?)",
+            (url, datetime.utcnow().isoformat(), orjson.dumps(details).decode()),
+        )
+
+
 def _update_database(products: List[Dict[str, Any]]) -> None:
     """Insert new listings or update existing records in the SQLite database."""
 
-    conn = sqlite3.connect(DB_PATH)
-    _init_db(conn)
-    cur = conn.cursor()
-    now = datetime.utcnow().isoformat()
-
-    seen_ids = set()
-    for product in products:
-        seen_ids.add(str(product["id"]))
-        price = None
-        if product.get("price"):
-            try:
-                price = float(product["price"].replace("€", ""))
-            except ValueError:
-                price = None
-        cur.execute(
-            """
-            INSERT INTO listings (id, title, price, status, last_seen, url, start_date, highest_bid)
-            VALUES (?, ?, ?, 'available', ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                title=excluded.title,
-                price=excluded.price,
-                status='available',
-                last_seen=excluded.last_seen,
-                url=excluded.url,
-                start_date=COALESCE(start_date, excluded.start_date),
-                highest_bid=excluded.highest_bid
-            """,
+    conn = _connect(DB_PATH)
+    try:
+        _init_db(conn)
+        now = datetime.utcnow().isoformat()
+        rows = [
             (
                 product.get("id"),
                 product.get("title"),
-                price,
+                product.get("price"),
                 now,
                 product.get("url"),
                 product.get("start_date"),
                 product.get("highest_bid"),
-            ),
-        )
-
-    # Mark listings not seen in this scrape as sold
-    cur.execute("SELECT id FROM listings WHERE status='available'")
-    existing_ids = {row[0] for row in cur.fetchall()}
-    missing = existing_ids - seen_ids
-    for listing_id in missing:
-        cur.execute(
-            "UPDATE listings SET status='sold', final_price=price, price=NULL WHERE id=?",
-            (listing_id,),
-        )
+            )
+            for product in products
+        ]
+        seen_ids = {str(product["id"]) for product in products}
+
+        with conn:
+            cur = conn.cursor()
+            cur.executemany(
+                """
+                INSERT INTO listings (id, title, price, status, last_seen, url, start_date, highest_bid)
+                VALUES (?, ?, ?, 'available', ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    title=excluded.title,
+                    price=excluded.price,
+                    status='available',
+                    last_seen=excluded.last_seen,
+                    url=excluded.url,
+                    start_date=COALESCE(start_date, excluded.start_date),
+                    highest_bid=excluded.highest_bid
+                """,
+                rows,
+            )
 
-    conn.commit()
-    conn.close()
+            # Mark listings not seen in this scrape as sold
+            cur.execute("CREATE TEMP TABLE seen (id TEXT PRIMARY KEY)")
+            cur.executemany("INSERT INTO seen (id) VALUES (?)", [(i,) for i in seen_ids])
+            cur.execute(
+                """
+                UPDATE listings SET status='sold', final_price=price, price=NULL
+                WHERE status='available' AND id NOT IN (SELECT id FROM seen)
+                """
+            )
+            cur.execute("DROP TABLE seen")
+    finally:
+        conn.close()
 
 def init_db(path: str = "listings.db") -> sqlite3.Connection:
     """Create the listings table if needed and return a connection."""
-    conn = sqlite3.connect(path)
+    conn = _connect(path)
     conn.execute(
         "CREATE TABLE IF NOT EXISTS listings (id TEXT PRIMARY KEY, data TEXT, status TEXT)"
     )
@@ -136,7 +227,7 @@ def save_listings(conn: sqlite3.Connection, listings: List[Dict[str, Any]]) -> N
     for listing in listings:
         conn.execute(
             "INSERT OR IGNORE INTO listings (id, data, status) VALUES (?, ?, 'new')",
-            (listing["id"], json.dumps(listing)),
+            (listing["id"], orjson.dumps(listing).decode()),
         )
     conn.commit()
 
@@ -145,7 +236,7 @@ def get_new_listings(conn: sqlite3.Connection) -> tuple[List[Dict[str, Any]], Li
     """Return listings marked as ``new`` along with their ids."""
     cur = conn.execute("SELECT id, data FROM listings WHERE status='new'")
     rows = cur.fetchall()
-    listings = [json.loads(row[1]) for row in rows]
+    listings = [orjson.loads(row[1]) for row in rows]
     ids = [row[0] for row in rows]
     return listings, ids
 
@@ -179,37 +270,136 @@ def is_broken_product(listing: Dict[str, Any]) -> bool:
     description text and any attribute values are inspected.
     """
 
-    keywords = ["defect", "broken", "parts", "spares", "repair"]
-
     # Collect text fields to scan for the keywords.
     text_parts: List[str] = []
     description = listing.get("description") or ""
-    text_parts.append(description.lower())
+    text_parts.append(description)
 
     attributes = listing.get("attributes") or []
     for attr in attributes:
         for value in attr.values():
             if isinstance(value, str):
-                text_parts.append(value.lower())
+                text_parts.append(value)
 
-    text = " ".join(text_parts)
-    return any(keyword in text for keyword in keywords)
+    text = " ".join(text_parts).lower()
+    return _BROKEN_RE.search(text) is not None
 
 
-def _parse_listing_script(soup: BeautifulSoup) -> Dict[str, Any]:
+def _next_data_blob(raw: bytes) -> bytes:
+    """Return the JSON text of the ``__NEXT_DATA__`` script element.
+
+    The script is located with a regular expression so that the HTML does not
+    have to be tokenized.  selectolax is only used when the tag is written in
+    a form the expression does not recognise, e.g. with ``id`` after another
+    attribute.
+    """
+
+    match = _NEXT_DATA_RE.search(raw)
+    if match:
+        return match.group(1)
+
+    node = LexborHTMLParser(raw).css_first("script#__NEXT_DATA__")
+    if node is not None:
+        return node.text().encode()
+    raise RuntimeError("Unable to locate data script in page")
+
+
+def _parse_next_data(raw: bytes) -> Dict[str, Any]:
     """Extract the JSON payload from the ``__NEXT_DATA__`` script element."""
 
-    script = soup.find("script", id="__NEXT_DATA__")
-    if not script:
-        raise RuntimeError("Unable to locate data script in page")
-    return json.loads(script.string)
+    return orjson.loads(_next_data_blob(raw))
 
 
-def fetch_listing_details(vip_url: str) -> Dict[str, Any]:
+def _retry_after(response: aiohttp.ClientResponse) -> Optional[float]:
+    """Return the delay requested by a ``Retry-After`` header, in seconds.
+
+    The delay is capped at ``MAX_RETRY_AFTER``; values that cannot be parsed
+    or are not finite are ignored.
+    """
+
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        delay = (when - datetime.now(timezone.utc)).total_seconds()
+    if not math.isfinite(delay):
+        return None
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
+async def _fetch(session: aiohttp.ClientSession, url: str) -> bytes:
+    """Return the raw body of ``url``, raising for HTTP error statuses.
+
+    Connection errors, timeouts and responses with a status in
+    ``RETRY_STATUSES`` are retried up to ``MAX_RETRIES`` times with
+    exponential backoff.  A ``Retry-After`` header on 429 and 503 responses
+    takes precedence over the backoff.
+    """
+
+    attempt = 0
+    while True:
+        delay = RETRY_BACKOFF * 2**attempt
+        try:
+            async with session.get(url) as response:
+                if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    response.raise_for_status()
+                    return await response.read()
+                if response.status in (429, 503):
+                    retry_after = _retry_after(response)
+                    if retry_after is not None:
+                        delay = retry_after
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _client_session() -> aiohttp.ClientSession:
+    """Create the HTTP session shared by all requests of a scrape.
+
+    The connector keeps connections to Marktplaats alive between requests so
+    that detail pages reuse already established TLS connections.
+    """
+
+    return aiohttp.ClientSession(
+        headers=DEFAULT_HEADERS,
+        connector=aiohttp.TCPConnector(
+            limit=MAX_CONCURRENCY,
+            limit_per_host=MAX_CONCURRENCY,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ),
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+    )
+
+
+def _run(func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+    """Run ``func(session, *args)`` to completion inside a fresh event loop."""
+
+    async def runner() -> Any:
+        async with _client_session() as session:
+            return await func(session, *args)
+
+    return asyncio.run(runner())
+
+
+async def afetch_listing_details(
+    session: aiohttp.ClientSession, vip_url: str
+) -> Dict[str, Any]:
     """Fetch additional information for a listing.
 
     Parameters
     ----------
+    session:
+        HTTP session used to perform the request.
     vip_url:
         Absolute URL of the listing's detail page.
 
@@ -222,14 +412,12 @@ def fetch_listing_details(vip_url: str) -> Dict[str, Any]:
     """
 
     try:
-        response = requests.get(vip_url, headers=DEFAULT_HEADERS, timeout=30)
-        response.raise_for_status()
-    except requests.RequestException as exc:
+        raw = await _fetch(session, vip_url)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
         logger.warning("Failed to fetch listing details from %s: %s", vip_url, exc)
         return {}
-    soup = BeautifulSoup(response.text, "html.parser")
     try:
-        data = _parse_listing_script(soup)
+        data = _parse_next_data(raw)
     except RuntimeError:
         return {}
 
@@ -239,6 +427,8 @@ def fetch_listing_details(vip_url: str) -> Dict[str, Any]:
         .get("initialState", {})
         .get("listing", {})
     )
+    if not listing:
+        return {}
 
     seller = listing.get("sellerInformation") or {}
     bidding = listing.get("bidding") or {}
@@ -275,30 +465,69 @@ def fetch_listing_details(vip_url: str) -> Dict[str, Any]:
     }
 
 
-def fetch_listings(url: str) -> List[Dict[str, Any]]:
-    """Return non-commercial product dictionaries from a search results page.
+def fetch_listing_details(vip_url: str) -> Dict[str, Any]:
+    """Synchronous wrapper around :func:`afetch_listing_details`."""
 
-    Each product dictionary now contains additional information such as the
-    description, seller details, posting date, shipping options and attribute
-    list.  When certain fields are missing from the search results payload we
-    fall back to fetching the listing's detail page.
+    return _run(afetch_listing_details, vip_url)
+
+
+async def _afetch_search(session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
+    """Return the ``searchRequestAndResponse`` object of a search page.
+
+    Raises ``RuntimeError`` when the page carries no search results, e.g. a
+    bot check, so that it is never mistaken for an empty result page.
     """
 
-    response = requests.get(url, headers=DEFAULT_HEADERS, timeout=30)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
-    data = _parse_listing_script(soup)
-    search = data["props"]["pageProps"]["searchRequestAndResponse"]
-    listings = search.get("listings", [])
-    products: List[Dict[str, Any]] = []
+    raw = await _fetch(session, url)
+    data = _parse_next_data(raw)
+    search = data.get("props", {}).get("pageProps", {}).get("searchRequestAndResponse")
+    if not isinstance(search, dict) or "listings" not in search:
+        raise RuntimeError(f"No search results in page {url}")
+    return search
 
-    for item in listings:
-        if is_commercial(item):
-            continue
 
+def _may_take_bids(item: Dict[str, Any]) -> bool:
+    return item.get("priceInfo", {}).get("priceType") not in NO_BIDDING_PRICE_TYPES
+
+
+def _needs_details(product: Dict[str, Any], item: Dict[str, Any]) -> bool:
+    """Return ``True`` if the listing's detail page has data we are missing.
+
+    Bids are only published on the detail page, so listings that may have
+    received bids are always fetched.
+    """
+
+    if _may_take_bids(item):
+        return True
+    return any(product.get(key) in (None, [], {}) for key in DETAIL_FIELDS)
+
+
+async def _aprocess_search(
+    session: aiohttp.ClientSession,
+    search: Dict[str, Any],
+    semaphore: Optional[asyncio.Semaphore] = None,
+    cache: Optional[sqlite3.Connection] = None,
+) -> List[Dict[str, Any]]:
+    """Build product dictionaries from a parsed search results payload.
+
+    Detail pages are only requested for listings with missing fields; those
+    are fetched concurrently, with at most ``MAX_CONCURRENCY`` requests in
+    flight per ``semaphore``.  When ``cache`` is given, details of listings
+    that cannot take bids are read from and stored in it.
+    """
+
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    # Bumped listings can appear more than once on a page; keep the first.
+    items: Dict[str, Dict[str, Any]] = {}
+    for item in search.get("listings") or []:
+        if item.get("itemId") not in items and not is_commercial(item):
+            items[item.get("itemId")] = item
+    products: List[Dict[str, Any]] = []
+
+    for item in items.values():
         price_info = item.get("priceInfo", {})
         price_cents = price_info.get("priceCents")
-        price = f"€{price_cents / 100:.2f}" if price_cents is not None else None
 
         image_urls = item.get("imageUrls") or []
         image_url: Optional[str] = None
@@ -311,22 +540,49 @@ def fetch_listings(url: str) -> List[Dict[str, Any]]:
         product: Dict[str, Any] = {
             "id": item.get("itemId"),
             "title": item.get("title"),
-            "price": price,
+            "price": price_cents / 100 if price_cents is not None else None,
+            "price_cents": price_cents,
             "location": item.get("location", {}).get("locationName"),
             "url": "https://www.marktplaats.nl" + item.get("vipUrl", ""),
             "image_url": image_url,
             "description": item.get("description"),
             "seller": seller,
+            "seller_name": seller.get("sellerName"),
             "seller_rating": seller.get("sellerReviewAverage")
             or seller.get("sellerReviewScore"),
             "start_date": item.get("startDate") or item.get("date"),
             "shipping_options": item.get("shippingOptions"),
             "attributes": item.get("attributes"),
         }
+        products.append(product)
 
-        # Fill in any missing fields from the listing detail page.
-        details = fetch_listing_details(product["url"])
-        time.sleep(random.uniform(1, 2))
+    async def details_for(
+        product: Dict[str, Any], item: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        if not _needs_details(product, item):
+            return {}
+        # Bids change between runs, so listings that may take them bypass the
+        # cache.  Cache hits skip the semaphore and the delay between requests.
+        use_cache = cache is not None and not _may_take_bids(item)
+        if use_cache:
+            cached = _cached_details(cache, product["url"])
+            if cached is not None:
+                return cached
+        async with semaphore:
+            details = await afetch_listing_details(session, product["url"])
+            await asyncio.sleep(random.uniform(1, 2))
+        if use_cache and details:
+            _store_details(cache, product["url"], details)
+        return details
+
+    # Fill in any missing fields from the listing detail pages.
+    tasks = [
+        details_for(product, item) for product, item in zip(products, items.values())
+    ]
+    results = await asyncio.gather(*tasks)
+
+    broken: List[Dict[str, Any]] = []
+    for product, details in zip(products, results):
         for key, value in details.items():
             if product.get(key) in (None, [], {}):
                 product[key] = value
@@ -335,39 +591,127 @@ def fetch_listings(url: str) -> List[Dict[str, Any]]:
         if not product["is_broken"]:
             continue
 
-        products.append(product)
+        broken.append(product)
 
-    return products
+    return broken
 
 
-def fetch_all_listings(url: str) -> List[Dict[str, Any]]:
-    """Fetch listings from all result pages for a search query."""
+async def afetch_listings(
+    session: aiohttp.ClientSession,
+    url: str,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    cache: Optional[sqlite3.Connection] = None,
+) -> List[Dict[str, Any]]:
+    """Return non-commercial product dictionaries from a search results page.
+
+    Each product dictionary now contains additional information such as the
+    description, seller details, posting date, shipping options and attribute
+    list.  When certain fields are missing from the search results payload we
+    fall back to fetching the listing's detail page.
+    """
+
+    search = await _afetch_search(session, url)
+    return await _aprocess_search(session, search, semaphore, cache)
+
+
+def fetch_listings(url: str) -> List[Dict[str, Any]]:
+    """Synchronous wrapper around :func:`afetch_listings`."""
+
+    return _run(afetch_listings, url)
+
+
+def _page_url(url: str, page: int) -> str:
+    return f"{url}?p={page}" if page > 1 else url
+
+
+async def afetch_all_listings(
+    session: aiohttp.ClientSession, url: str
+) -> List[Dict[str, Any]]:
+    """Fetch listings from all result pages for a search query.
+
+    The first page is fetched on its own to learn the total result count; the
+    remaining pages are then requested concurrently.  When the count is not
+    available the pages are walked one by one until no new listings appear.
+    Listing details are cached in ``DB_PATH`` across runs.
+    """
+
+    cache = _open_details_cache(DB_PATH)
+    try:
+        return await _afetch_pages(session, url, cache)
+    finally:
+        cache.close()
+
+
+async def _afetch_pages(
+    session: aiohttp.ClientSession, url: str, cache: sqlite3.Connection
+) -> List[Dict[str, Any]]:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    first = await _afetch_search(session, url)
+    total = first.get("totalResultCount")
+    page_size = len(first.get("listings") or [])
 
-    page = 1
     all_products: List[Dict[str, Any]] = []
     seen_ids = set()
 
-    while True:
-        page_url = f"{url}?p={page}" if page > 1 else url
-        products = fetch_listings(page_url)
+    def collect(products: List[Dict[str, Any]]) -> bool:
         new_products = [p for p in products if p["id"] not in seen_ids]
-        if not new_products:
-            break
-
         all_products.extend(new_products)
         seen_ids.update(p["id"] for p in new_products)
+        return bool(new_products)
+
+    if isinstance(total, int) and page_size:
+        pages = math.ceil(total / page_size)
+        results = await asyncio.gather(
+            _aprocess_search(session, first, semaphore, cache),
+            *(
+                afetch_listings(session, _page_url(url, page), semaphore, cache)
+                for page in range(2, pages + 1)
+            ),
+        )
+        for products in results:
+            collect(products)
+        return all_products
+
+    if not collect(await _aprocess_search(session, first, semaphore, cache)):
+        return all_products
+    page = 2
+    while True:
+        await asyncio.sleep(2)  # Add a 2-second delay between page requests
+        products = await afetch_listings(
+            session, _page_url(url, page), semaphore, cache
+        )
+        if not collect(products):
+            break
         page += 1
-        time.sleep(2) # Add a 2-second delay between page requests
 
     return all_products
 
 
+def fetch_all_listings(url: str) -> List[Dict[str, Any]]:
+    """Synchronous wrapper around :func:`afetch_all_listings`."""
+
+    return _run(afetch_all_listings, url)
+
+
+def _write_snapshot(products: List[Dict[str, Any]]) -> None:
+    """Write the scraped products to the JSON file read by the dashboard.
+
+    The data is written to a temporary file that then replaces the snapshot,
+    so readers never see a partially written file.
+    """
+
+    path = "marktplaats_listings.json"
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(products, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+
+
 def main() -> None:
 
     products = fetch_all_listings(SEARCH_URL)
     _update_database(products)
-    with open("marktplaats_listings.json", "w") as f:
-        json.dump(products, f, indent=4)
+    _write_snapshot(products)
     print(f"Total products scraped: {len(products)}")
 
     conn = init_db()
@@ -381,8 +725,7 @@ def main() -> None:
         if ids:
             mark_listings_active(conn, ids)
 
-        with open("marktplaats_listings.json", "w") as f:
-            json.dump(products, f, indent=4)
+        _write_snapshot(products)
         print(f"Total products scraped: {len(products)}")
     finally:
         conn.close()
@@ -9,7 +9,7 @@ document.addEventListener('DOMContentLoaded', function () {
 
       if (listing) {
         document.getElementById('modalTitle').textContent = listing.title || '';
-        document.getElementById('modalPrice').textContent = listing.price || 'N/A';
+        document.getElementById('modalPrice').textContent = typeof listing.price === 'number' ? '€' + listing.price.toFixed(2) : (listing.price || 'N/A');
         document.getElementById('modalLocation').textContent = listing.location || 'N/A';
         document.getElementById('modalDate').textContent = listing.start_date || 'N/A';
         document.getElementById('modalSeller').textContent = listing.seller ? listing.seller.sellerName : 'N/A';
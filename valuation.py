@@ -2,9 +2,10 @@ import json
 import sqlite3
 from datetime import datetime, timedelta
 from statistics import median
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
 DB_PATH = "data.db"
 
@@ -15,74 +16,102 @@ PRODUCT_RULES: Dict[str, List[str]] = {
 
 THRESHOLD = 80
 
+# Flattened ``(key, lowercase pattern)`` pairs derived from PRODUCT_RULES.
+_LOWER_RULES = [
+    (key, pattern.lower()) for key, patterns in PRODUCT_RULES.items() for pattern in patterns
+]
+_PATTERN_KEYS = [key for key, _ in _LOWER_RULES]
+_PATTERNS = [pattern for _, pattern in _LOWER_RULES]
+
 
 def match_product_key(title: str) -> Optional[str]:
     """Return the product key that best matches a listing title."""
     title = title.lower()
     best_key: Optional[str] = None
     best_score = 0
-    for key, patterns in PRODUCT_RULES.items():
-        for pattern in patterns:
-            score = fuzz.partial_ratio(pattern.lower(), title)
-            if score > best_score:
-                best_key, best_score = key, score
+    for key, pattern in _LOWER_RULES:
+        score = fuzz.partial_ratio(pattern, title)
+        if score > best_score:
+            best_key, best_score = key, score
     if best_score >= THRESHOLD:
         return best_key
     return None
 
 
-def winsorize(values: List[float], lower_pct: float = 0.1, upper_pct: float = 0.9) -> List[float]:
+def match_product_keys(titles: List[str]) -> List[Optional[str]]:
+    """Return the best matching product key for each title in one batch.
+
+    Equivalent to calling :func:`match_product_key` per title, but the whole
+    title x pattern score matrix is computed natively by rapidfuzz.
+    """
+    if not titles or not _PATTERNS:
+        return [None] * len(titles)
+    scores = process.cdist(
+        [title.lower() for title in titles],
+        _PATTERNS,
+        scorer=fuzz.partial_ratio,
+        score_cutoff=THRESHOLD,
+        workers=-1,
+    )
+    best = scores.argmax(axis=1)
+    return [
+        _PATTERN_KEYS[j] if scores[i, j] >= THRESHOLD else None
+        for i, j in enumerate(best)
+    ]
+
+
+def winsorize(values: Sequence[float], lower_pct: float = 0.1, upper_pct: float = 0.9) -> np.ndarray:
     """Clamp values to the given percentile range."""
-    if not values:
-        return []
-    sorted_vals = sorted(values)
-    n = len(sorted_vals)
-    lower_idx = int(n * lower_pct)
-    upper_idx = int(n * upper_pct) - 1
-    lower = sorted_vals[lower_idx]
-    upper = sorted_vals[upper_idx]
-    return [min(max(v, lower), upper) for v in values]
-
-
-def percentile(values: List[float], pct: float) -> float:
-    if not values:
+    a = np.asarray(values, dtype=np.float64)
+    n = a.size
+    if not n:
+        return a
+    sorted_vals = np.sort(a)
+    lower = sorted_vals[int(n * lower_pct)]
+    upper = sorted_vals[int(n * upper_pct) - 1]
+    return np.clip(a, lower, upper)
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    if not len(values):
         return float("nan")
-    sorted_vals = sorted(values)
-    k = (len(sorted_vals) - 1) * pct
-    f = int(k)
-    c = k - f
-    if f + 1 < len(sorted_vals):
-        return sorted_vals[f] + (sorted_vals[f + 1] - sorted_vals[f]) * c
-    return sorted_vals[f]
+    return float(np.quantile(values, pct))
 
 
 def analyze(db_path: str = DB_PATH) -> Dict[str, Dict[str, float]]:
     conn = sqlite3.connect(db_path)
     cutoff = (datetime.utcnow() - timedelta(days=90)).isoformat()
     try:
+        # Filtering, the clearing price and the listing duration are computed
+        # by SQLite so that only numeric columns reach Python.
         cur = conn.execute(
-            "SELECT title, price, final_price, start_date, last_seen, highest_bid FROM listings WHERE last_seen >= ?",
+            """
+            SELECT
+                title,
+                CASE
+                    WHEN highest_bid IS NOT NULL THEN MAX(highest_bid, ask * 0.8)
+                    ELSE ask
+                END AS clearing,
+                CAST(julianday(last_seen) - julianday(start_date) AS INTEGER) AS duration
+            FROM (
+                SELECT title, COALESCE(final_price, price) AS ask, highest_bid, start_date, last_seen
+                FROM listings
+                WHERE last_seen >= ?
+            )
+            WHERE ask IS NOT NULL
+            """,
             (cutoff,),
         )
     except sqlite3.OperationalError:
         return {}
 
+    rows = cur.fetchall()
+    keys = match_product_keys([row[0] or "" for row in rows])
+
     products: Dict[str, Dict[str, List[float]]] = {}
-    for title, price, final_price, start_date, last_seen, highest_bid in cur.fetchall():
-        key = match_product_key(title or "")
+    for key, (_, clearing, duration) in zip(keys, rows):
         if key is None:
             continue
-        ask = final_price if final_price is not None else price
-        if ask is None:
-            continue
-        if highest_bid is not None:
-            clearing = max(highest_bid, ask * 0.8)
-        else:
-            clearing = ask
-        start_dt = datetime.fromisoformat(start_date) if start_date else None
-        last_dt = datetime.fromisoformat(last_seen) if last_seen else None
-        duration = (last_dt - start_dt).days if start_dt and last_dt else None
-
         rec = products.setdefault(key, {"prices": [], "durations": []})
         rec["prices"].append(clearing)
         if duration is not None:
@@ -91,9 +120,7 @@ def analyze(db_path: str = DB_PATH) -> Dict[str, Dict[str, float]]:
     results: Dict[str, Dict[str, float]] = {}
     for key, rec in products.items():
         prices = winsorize(rec["prices"])
-        p25 = percentile(prices, 0.25)
-        med = percentile(prices, 0.5)
-        p75 = percentile(prices, 0.75)
+        p25, med, p75 = (float(q) for q in np.quantile(prices, [0.25, 0.5, 0.75]))
         tt_disp = median(rec["durations"]) if rec["durations"] else float("nan")
         results[key] = {
             "p25": p25,